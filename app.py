@@ -46,13 +46,40 @@ st.markdown("**Interactive analysis with predictive insights and advanced visual
 # ---------------------------
 # DATA LOADING
 # ---------------------------
+CATEGORY_COLS = ['Season', 'HomeTeam', 'AwayTeam', 'FullTimeResult', 'HalfTimeResult', 'Referee']
+GOAL_COLS = ['FullTimeHomeGoals', 'FullTimeAwayGoals', 'HalfTimeHomeGoals', 'HalfTimeAwayGoals']
+
 @st.cache_data
 def load_data(file):
-    df = pd.read_csv(file)
+    # Multi-threaded pyarrow parser; low-cardinality text columns land straight in categoricals
+    df = pd.read_csv(file, engine='pyarrow', dtype={col: 'category' for col in CATEGORY_COLS})
     if 'MatchDate' in df.columns:
         df['MatchDate'] = pd.to_datetime(df['MatchDate'])
+        # Chronological order lets the date filter take one contiguous slice
+        df = df.sort_values('MatchDate', kind='mergesort').reset_index(drop=True)
+        # Months since year 0, a cheap integer key for monthly groupings
+        df['MatchMonth'] = (df['MatchDate'].dt.year * 12 + df['MatchDate'].dt.month - 1).astype('int32')
+    
+    # Share one set of team categories so home and away columns compare and align cleanly
+    if 'HomeTeam' in df.columns and 'AwayTeam' in df.columns:
+        teams = df['HomeTeam'].cat.categories.union(df['AwayTeam'].cat.categories)
+        df['HomeTeam'] = df['HomeTeam'].cat.set_categories(teams)
+        df['AwayTeam'] = df['AwayTeam'].cat.set_categories(teams)
+    
+    for col in GOAL_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    
+    # Sum of the downcast goal columns, so it stays uint8 as well
+    df['TotalGoals'] = df['FullTimeHomeGoals'] + df['FullTimeAwayGoals']
     return df
 
+@st.cache_data
+def list_all_teams(df):
+    # Union of the small category indexes rather than every row's team name
+    teams = df['HomeTeam'].cat.categories.union(df['AwayTeam'].cat.categories)
+    return sorted(teams.tolist())
+
 # Sidebar for file upload
 with st.sidebar:
     st.header("🔧 Configuration")
@@ -67,6 +94,23 @@ with st.sidebar:
             st.error("Please upload a CSV file to continue.")
             st.stop()
 
+# Dataset-wide constants only change with the data source, so compute them once per session
+data_source = uploaded_file.file_id if uploaded_file else "data/epl_cleaned.csv"
+if st.session_state.get('df_source') != data_source:
+    df_meta = {
+        'all_teams': list_all_teams(df),
+        'max_total_goals': int(df['TotalGoals'].max()),
+        'total_records': len(df)
+    }
+    if 'Season' in df.columns:
+        df_meta['seasons'] = sorted(df['Season'].unique())
+    if 'MatchDate' in df.columns:
+        df_meta['min_date'] = df['MatchDate'].min().date()
+        df_meta['max_date'] = df['MatchDate'].max().date()
+    st.session_state.df_meta = df_meta
+    st.session_state.df_source = data_source
+df_meta = st.session_state.df_meta
+
 # ---------------------------
 # ADVANCED FILTERS
 # ---------------------------
@@ -74,51 +118,61 @@ with st.sidebar:
     st.header("🔍 Advanced Filters")
     
     # Team filter with multiselect
-    all_teams = sorted(set(df['HomeTeam']).union(df['AwayTeam']))
+    all_teams = df_meta['all_teams']
     selected_teams = st.multiselect("Select Teams", all_teams, default=all_teams[:5])
     
     # Season filter
     if 'Season' in df.columns:
-        seasons = sorted(df['Season'].unique())
+        seasons = df_meta['seasons']
         selected_seasons = st.multiselect("Select Seasons", seasons, default=seasons)
     
     # Date range filter
     if 'MatchDate' in df.columns:
-        min_date = df['MatchDate'].min().date()
-        max_date = df['MatchDate'].max().date()
+        min_date = df_meta['min_date']
+        max_date = df_meta['max_date']
         date_range = st.date_input("Select Date Range", 
                                  value=(min_date, max_date),
                                  min_value=min_date,
                                  max_value=max_date)
     
     # Goals filter
+    max_total_goals = df_meta['max_total_goals']
     min_goals, max_goals = st.slider("Total Goals Range", 
                                    0, 
-                                   int(df['FullTimeHomeGoals'].max() + df['FullTimeAwayGoals'].max()),
-                                   (0, 10))
+                                   max_total_goals,
+                                   (0, min(10, max_total_goals)))
 
 # Apply filters
-filtered_df = df.copy()
-if selected_teams:
-    filtered_df = filtered_df[
-        (filtered_df['HomeTeam'].isin(selected_teams)) | 
-        (filtered_df['AwayTeam'].isin(selected_teams))
-    ]
-
-if 'Season' in df.columns and selected_seasons:
-    filtered_df = filtered_df[filtered_df['Season'].isin(selected_seasons)]
+@st.cache_data
+def compute_filtered(df, teams, seasons, date_lo, date_hi, min_goals, max_goals):
+    if date_lo is not None and date_hi is not None:
+        # Rows are sorted by date at load time, so the range is found by binary search
+        match_dates = df['MatchDate'].values
+        start = np.searchsorted(match_dates, np.datetime64(date_lo))
+        end = np.searchsorted(match_dates, np.datetime64(date_hi) + np.timedelta64(1, 'D'))
+        df = df.iloc[start:end]
+    
+    # Combine the remaining conditions into one mask so the frame is only sliced once
+    mask = np.ones(len(df), dtype=bool)
+    if teams:
+        mask &= df['HomeTeam'].isin(teams).values | df['AwayTeam'].isin(teams).values
+    
+    if seasons:
+        mask &= df['Season'].isin(seasons).values
+    
+    total_goals = df['TotalGoals'].values
+    mask &= (total_goals >= min_goals) & (total_goals <= max_goals)
+    return df.loc[mask]
 
+# Tuples keep the cache keys hashable and independent of selection order
+season_filter = tuple(sorted(selected_seasons)) if 'Season' in df.columns else ()
 if 'MatchDate' in df.columns and len(date_range) == 2:
-    filtered_df = filtered_df[
-        (filtered_df['MatchDate'].dt.date >= date_range[0]) &
-        (filtered_df['MatchDate'].dt.date <= date_range[1])
-    ]
+    date_lo, date_hi = date_range
+else:
+    date_lo, date_hi = None, None
 
-filtered_df['TotalGoals'] = filtered_df['FullTimeHomeGoals'] + filtered_df['FullTimeAwayGoals']
-filtered_df = filtered_df[
-    (filtered_df['TotalGoals'] >= min_goals) & 
-    (filtered_df['TotalGoals'] <= max_goals)
-]
+filtered_df = compute_filtered(df, tuple(sorted(selected_teams)), season_filter,
+                               date_lo, date_hi, min_goals, max_goals)
 
 # ---------------------------
 # MAIN DASHBOARD WITH TABS
@@ -133,8 +187,9 @@ with tab1:
     total_matches = len(filtered_df)
     total_goals = filtered_df['TotalGoals'].sum()
     avg_goals = filtered_df['TotalGoals'].mean()
-    home_wins = len(filtered_df[filtered_df['FullTimeResult'] == 'H'])
-    away_wins = len(filtered_df[filtered_df['FullTimeResult'] == 'A'])
+    result_counts = filtered_df['FullTimeResult'].value_counts()
+    home_wins = int(result_counts.get('H', 0))
+    away_wins = int(result_counts.get('A', 0))
     
     with col1:
         st.metric("Total Matches", total_matches)
@@ -160,7 +215,6 @@ with tab1:
     
     with col2:
         # Results pie chart
-        result_counts = filtered_df['FullTimeResult'].value_counts()
         result_labels = {'H': 'Home Win', 'A': 'Away Win', 'D': 'Draw'}
         fig_pie = px.pie(values=result_counts.values, 
                         names=[result_labels.get(x, x) for x in result_counts.index],
@@ -168,59 +222,61 @@ with tab1:
         st.plotly_chart(fig_pie, use_container_width=True)
 
 # TAB 2: ENHANCED LEAGUE TABLE
+@st.cache_data
+def build_league_table(filtered_df, teams):
+    # Widen the downcast goal columns so per-team totals cannot overflow
+    results = filtered_df[['HomeTeam', 'AwayTeam']].copy()
+    results['FullTimeHomeGoals'] = filtered_df['FullTimeHomeGoals'].astype(int)
+    results['FullTimeAwayGoals'] = filtered_df['FullTimeAwayGoals'].astype(int)
+    results['_H'] = (filtered_df['FullTimeResult'] == 'H').astype(int)
+    results['_D'] = (filtered_df['FullTimeResult'] == 'D').astype(int)
+    results['_A'] = (filtered_df['FullTimeResult'] == 'A').astype(int)
+    
+    # Aggregate each team's home and away fixtures, then combine them
+    table_cols = ['Wins', 'Draws', 'Losses', 'GF', 'GA']
+    home_agg = results.groupby('HomeTeam', observed=True, sort=False)[['_H', '_D', '_A', 'FullTimeHomeGoals', 'FullTimeAwayGoals']].sum()
+    home_agg.columns = table_cols
+    away_agg = results.groupby('AwayTeam', observed=True, sort=False)[['_A', '_D', '_H', 'FullTimeAwayGoals', 'FullTimeHomeGoals']].sum()
+    away_agg.columns = table_cols
+    
+    league_df = home_agg.add(away_agg, fill_value=0).reindex(list(teams), fill_value=0).astype(int)
+    league_df['Played'] = league_df['Wins'] + league_df['Draws'] + league_df['Losses']
+    league_df = league_df[league_df['Played'] > 0]
+    league_df['GD'] = league_df['GF'] - league_df['GA']
+    league_df['Points'] = league_df['Wins'] * 3 + league_df['Draws']
+    league_df['Points per Game'] = (league_df['Points'] / league_df['Played']).round(2)
+    league_df.insert(0, 'Position', 0)
+    league_df = league_df.rename_axis('Team').reset_index()[[
+        'Position', 'Team', 'Played', 'Wins', 'Draws', 'Losses', 'GF', 'GA', 'GD', 'Points', 'Points per Game'
+    ]]
+    
+    league_df = league_df.sort_values(by=['Points', 'GD'], ascending=False).reset_index(drop=True)
+    league_df['Position'] = range(1, len(league_df) + 1)
+    
+    # Qualification zones, checked in order so the top spots win on short tables
+    league_df['Zone'] = np.select(
+        [league_df['Position'] <= 4, league_df['Position'] <= 6, league_df['Position'] >= len(league_df) - 2],
+        ['🟢 Champions League', '🟡 Europa League', '🔴 Relegation'],
+        default=''
+    )
+    return league_df
+
 with tab2:
     st.subheader("📊 Interactive League Table")
     
     # Calculate league table
-    league_table = []
     teams_to_show = selected_teams if selected_teams else all_teams
+    league_df = build_league_table(filtered_df, tuple(teams_to_show))
     
-    for team in teams_to_show:
-        home = filtered_df[filtered_df['HomeTeam'] == team]
-        away = filtered_df[filtered_df['AwayTeam'] == team]
-        
-        played = len(home) + len(away)
-        if played == 0:
-            continue
-            
-        wins = len(home[home['FullTimeResult'] == 'H']) + len(away[away['FullTimeResult'] == 'A'])
-        draws = len(home[home['FullTimeResult'] == 'D']) + len(away[away['FullTimeResult'] == 'D'])
-        losses = played - wins - draws
-        gf = home['FullTimeHomeGoals'].sum() + away['FullTimeAwayGoals'].sum()
-        ga = home['FullTimeAwayGoals'].sum() + away['FullTimeHomeGoals'].sum()
-        gd = gf - ga
-        points = wins * 3 + draws
-        
-        league_table.append({
-            'Position': 0,
-            'Team': team,
-            'Played': played,
-            'Wins': wins,
-            'Draws': draws,
-            'Losses': losses,
-            'GF': gf,
-            'GA': ga,
-            'GD': gd,
-            'Points': points,
-            'Points per Game': round(points/played, 2) if played > 0 else 0
-        })
-    
-    league_df = pd.DataFrame(league_table).sort_values(by=['Points', 'GD'], ascending=False).reset_index(drop=True)
-    league_df['Position'] = range(1, len(league_df) + 1)
-    
-    # Add color coding for positions
-    def color_positions(row):
-        if row['Position'] <= 4:
-            return ['background-color: #d4edda'] * len(row)  # Champions League (green)
-        elif row['Position'] <= 6:
-            return ['background-color: #fff3cd'] * len(row)  # Europa League (yellow)
-        elif row['Position'] >= len(league_df) - 2:
-            return ['background-color: #f8d7da'] * len(row)  # Relegation (red)
-        else:
-            return [''] * len(row)
-    
-    styled_df = league_df.style.apply(color_positions, axis=1)
-    st.dataframe(styled_df, use_container_width=True)
+    st.dataframe(
+        league_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Points per Game': st.column_config.NumberColumn(format="%.2f"),
+            'Zone': st.column_config.TextColumn(help="Champions League, Europa League or relegation places")
+        }
+    )
     
     # Top performers
     col1, col2, col3 = st.columns(3)
@@ -235,6 +291,26 @@ with tab2:
         st.metric("⚡ Most Efficient", most_efficient['Team'], f"{most_efficient['Points per Game']} PPG")
 
 # TAB 3: ADVANCED ANALYTICS
+@st.cache_data
+def home_away_stats(filtered_df):
+    home_stats = filtered_df.groupby('HomeTeam', observed=True, sort=False).agg({
+        'FullTimeHomeGoals': 'mean',
+        'FullTimeAwayGoals': 'mean'
+    }).reset_index()
+    home_stats['Goal_Difference'] = home_stats['FullTimeHomeGoals'] - home_stats['FullTimeAwayGoals']
+    return home_stats
+
+@st.cache_data
+def correlation_matrix(filtered_df, cols):
+    return filtered_df[list(cols)].corr().values
+
+@st.cache_data
+def monthly_goal_trend(filtered_df):
+    monthly_goals = filtered_df.groupby('MatchMonth')['TotalGoals'].mean().reset_index()
+    months = monthly_goals['MatchMonth']
+    monthly_goals['MatchDate'] = (months // 12).astype(str) + '-' + (months % 12 + 1).astype(str).str.zfill(2)
+    return monthly_goals
+
 with tab3:
     st.subheader("📈 Advanced Analytics")
     
@@ -243,11 +319,7 @@ with tab3:
     
     with col1:
         # Home advantage analysis
-        home_stats = filtered_df.groupby('HomeTeam').agg({
-            'FullTimeHomeGoals': 'mean',
-            'FullTimeAwayGoals': 'mean'
-        }).reset_index()
-        home_stats['Goal_Difference'] = home_stats['FullTimeHomeGoals'] - home_stats['FullTimeAwayGoals']
+        home_stats = home_away_stats(filtered_df)
         
         fig_home = px.scatter(home_stats, x='FullTimeHomeGoals', y='FullTimeAwayGoals',
                             text='HomeTeam', title="Home Performance: Goals For vs Against",
@@ -260,8 +332,7 @@ with tab3:
     with col2:
         # Goals over time
         if 'MatchDate' in filtered_df.columns:
-            monthly_goals = filtered_df.groupby(filtered_df['MatchDate'].dt.to_period('M'))['TotalGoals'].mean().reset_index()
-            monthly_goals['MatchDate'] = monthly_goals['MatchDate'].astype(str)
+            monthly_goals = monthly_goal_trend(filtered_df)
             
             fig_trend = px.line(monthly_goals, x='MatchDate', y='TotalGoals',
                               title="Average Goals per Match Over Time")
@@ -270,17 +341,31 @@ with tab3:
     
     # Correlation heatmap
     st.subheader("🔥 Performance Correlations")
-    numeric_cols = ['FullTimeHomeGoals', 'FullTimeAwayGoals', 'HalfTimeHomeGoals', 'HalfTimeAwayGoals']
-    available_cols = [col for col in numeric_cols if col in filtered_df.columns]
+    available_cols = [col for col in GOAL_COLS if col in filtered_df.columns]
     
     if len(available_cols) >= 2:
-        corr_matrix = filtered_df[available_cols].corr()
-        fig_heatmap = px.imshow(corr_matrix, text_auto=True, aspect="auto",
-                               title="Performance Metrics Correlation")
+        corr_matrix = correlation_matrix(filtered_df, tuple(available_cols))
+        fig_heatmap = go.Figure(go.Heatmap(z=corr_matrix, x=available_cols, y=available_cols,
+                                           text=np.round(corr_matrix, 2), texttemplate='%{text}'))
+        fig_heatmap.update_layout(title="Performance Metrics Correlation")
+        fig_heatmap.update_yaxes(autorange='reversed')
         st.plotly_chart(fig_heatmap, use_container_width=True)
 
 # TAB 4: PREDICTIONS
-with tab4:
+@st.cache_data
+def team_strength_tables(filtered_df):
+    home_strength = filtered_df.groupby('HomeTeam', observed=True, sort=False).agg(
+        scored=('FullTimeHomeGoals', 'mean'),
+        conceded=('FullTimeAwayGoals', 'mean')
+    )
+    away_strength = filtered_df.groupby('AwayTeam', observed=True, sort=False).agg(
+        scored=('FullTimeAwayGoals', 'mean'),
+        conceded=('FullTimeHomeGoals', 'mean')
+    )
+    return home_strength, away_strength
+
+@st.fragment
+def predictor_fragment(filtered_df, all_teams):
     st.subheader("🔮 Predictive Analytics")
     
     # Simple prediction model based on historical performance
@@ -294,14 +379,11 @@ with tab4:
     
     if st.button("Predict Match Outcome"):
         # Calculate team strengths based on recent performance
-        home_data = filtered_df[filtered_df['HomeTeam'] == home_team]
-        away_data = filtered_df[filtered_df['AwayTeam'] == away_team]
+        home_table, away_table = team_strength_tables(filtered_df)
         
-        if len(home_data) > 0 and len(away_data) > 0:
-            home_avg_scored = home_data['FullTimeHomeGoals'].mean()
-            home_avg_conceded = home_data['FullTimeAwayGoals'].mean()
-            away_avg_scored = away_data['FullTimeAwayGoals'].mean()
-            away_avg_conceded = away_data['FullTimeHomeGoals'].mean()
+        if home_team in home_table.index and away_team in away_table.index:
+            home_avg_scored, home_avg_conceded = home_table.loc[home_team]
+            away_avg_scored, away_avg_conceded = away_table.loc[away_team]
             
             # Simple prediction logic
             home_strength = home_avg_scored - home_avg_conceded
@@ -328,78 +410,88 @@ with tab4:
         else:
             st.warning("Not enough data for these teams in the selected filters.")
 
+with tab4:
+    predictor_fragment(filtered_df, all_teams)
+
 # TAB 5: TEAM DEEP DIVE
-with tab5:
+@st.cache_data
+def team_matches(filtered_df, team):
+    team_mask = (filtered_df['HomeTeam'] == team) | (filtered_df['AwayTeam'] == team)
+    return filtered_df[team_mask]
+
+@st.fragment
+def deep_dive_fragment(filtered_df, all_teams):
     st.subheader("🎯 Team Performance Deep Dive")
     
     selected_team_analysis = st.selectbox("Select Team for Analysis", all_teams, key="analysis_team")
     
     # Team-specific metrics
-    team_home = filtered_df[filtered_df['HomeTeam'] == selected_team_analysis]
-    team_away = filtered_df[filtered_df['AwayTeam'] == selected_team_analysis]
-    team_all = pd.concat([team_home, team_away])
+    team_all = team_matches(filtered_df, selected_team_analysis)
     
     if len(team_all) > 0:
+        at_home = (team_all['HomeTeam'] == selected_team_analysis).values
+        at_away = ~at_home
+        result = team_all['FullTimeResult'].values
+        home_goals = team_all['FullTimeHomeGoals'].values
+        away_goals = team_all['FullTimeAwayGoals'].values
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            home_record = f"{len(team_home[team_home['FullTimeResult'] == 'H'])}-{len(team_home[team_home['FullTimeResult'] == 'D'])}-{len(team_home[team_home['FullTimeResult'] == 'A'])}"
+            home_record = f"{(at_home & (result == 'H')).sum()}-{(at_home & (result == 'D')).sum()}-{(at_home & (result == 'A')).sum()}"
             st.metric("Home Record (W-D-L)", home_record)
         
         with col2:
-            away_record = f"{len(team_away[team_away['FullTimeResult'] == 'A'])}-{len(team_away[team_away['FullTimeResult'] == 'D'])}-{len(team_away[team_away['FullTimeResult'] == 'H'])}"
+            away_record = f"{(at_away & (result == 'A')).sum()}-{(at_away & (result == 'D')).sum()}-{(at_away & (result == 'H')).sum()}"
             st.metric("Away Record (W-D-L)", away_record)
         
         with col3:
-            goals_scored = team_home['FullTimeHomeGoals'].sum() + team_away['FullTimeAwayGoals'].sum()
+            goals_scored = np.where(at_home, home_goals, away_goals).sum()
             st.metric("Total Goals Scored", goals_scored)
         
         with col4:
-            goals_conceded = team_home['FullTimeAwayGoals'].sum() + team_away['FullTimeHomeGoals'].sum()
+            goals_conceded = np.where(at_home, away_goals, home_goals).sum()
             st.metric("Total Goals Conceded", goals_conceded)
         
         # Performance timeline
         if 'MatchDate' in team_all.columns:
-            team_all_sorted = team_all.sort_values('MatchDate')
+            # Matches are already in date order from load_data
+            home_pts = np.where(result == 'H', 3, np.where(result == 'D', 1, 0))
+            away_pts = np.where(result == 'A', 3, np.where(result == 'D', 1, 0))
+            cumulative_points = np.where(at_home, home_pts, away_pts).cumsum()
             
-            # Calculate rolling performance
-            def get_team_result(row, team):
-                if row['HomeTeam'] == team:
-                    if row['FullTimeResult'] == 'H': return 3
-                    elif row['FullTimeResult'] == 'D': return 1
-                    else: return 0
-                else:
-                    if row['FullTimeResult'] == 'A': return 3
-                    elif row['FullTimeResult'] == 'D': return 1
-                    else: return 0
-            
-            team_all_sorted['Points'] = team_all_sorted.apply(lambda x: get_team_result(x, selected_team_analysis), axis=1)
-            team_all_sorted['Cumulative_Points'] = team_all_sorted['Points'].cumsum()
-            
-            fig_timeline = px.line(team_all_sorted, x='MatchDate', y='Cumulative_Points',
+            fig_timeline = px.line(x=team_all['MatchDate'].values, y=cumulative_points,
+                                 labels={'x': 'MatchDate', 'y': 'Cumulative_Points'},
                                  title=f"{selected_team_analysis} - Cumulative Points Over Time")
             st.plotly_chart(fig_timeline, use_container_width=True)
 
+with tab5:
+    deep_dive_fragment(filtered_df, all_teams)
+
 # ---------------------------
 # REAL-TIME UPDATES
 # ---------------------------
 if st.sidebar.button("🔄 Refresh Data"):
     st.cache_data.clear()
+    st.session_state.pop('df_source', None)
     st.rerun()
 
 # ---------------------------
 # EXPORT FUNCTIONALITY
 # ---------------------------
+@st.cache_data
+def to_csv_bytes(filtered_df):
+    # MatchMonth is an internal grouping key, not part of the dataset
+    return filtered_df.drop(columns=['MatchMonth'], errors='ignore').to_csv(index=False).encode()
+
 with st.sidebar:
     st.header("📥 Export Options")
-    if st.button("Download Filtered Data"):
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="Download CSV",
-            data=csv,
-            file_name=f"epl_filtered_data_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
-        )
+    st.download_button(
+        label="Download Filtered Data",
+        data=to_csv_bytes(filtered_df),
+        file_name=f"epl_filtered_data_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv"
+    )
 
 # ---------------------------
 # FOOTER
@@ -409,10 +501,10 @@ col1, col2, col3 = st.columns(3)
 with col1:
     st.markdown("**Data Period:**")
     if 'MatchDate' in df.columns:
-        st.write(f"{df['MatchDate'].min().strftime('%Y-%m-%d')} to {df['MatchDate'].max().strftime('%Y-%m-%d')}")
+        st.write(f"{df_meta['min_date'].strftime('%Y-%m-%d')} to {df_meta['max_date'].strftime('%Y-%m-%d')}")
 with col2:
     st.markdown("**Total Records:**")
-    st.write(f"{len(df):,} matches")
+    st.write(f"{df_meta['total_records']:,} matches")
 with col3:
     st.markdown("**Last Updated:**")
     st.write(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))